@@ -7,7 +7,9 @@ import secrets
 from datetime import timedelta
 
 from flask import Flask
+from sqlalchemy.engine import make_url
 
+from cache import TTLCache
 from config import INSECURE_SECRET_KEYS, Config
 from models import Admin, Student, db
 from routes import admin, auth, main, student
@@ -43,6 +45,45 @@ def resolve_secret_key(secret_key, debug):
     )
 
 
+def engine_options(
+    database_url,
+    *,
+    pool_use_lifo=True,
+    pool_size=10,
+    max_overflow=10,
+    pool_timeout=30,
+    pool_recycle=1800,
+):
+    """Return the ``create_engine`` keyword arguments for ``database_url``.
+
+    SQLite is a file (or memory) on the same host, so it gets no tuning: there
+    is no socket to go stale, and Flask-SQLAlchemy swaps in a ``StaticPool`` for
+    in-memory databases that would reject pool arguments anyway.
+
+    For a server database (PostgreSQL in production):
+
+    * ``pool_pre_ping`` tests a connection on checkout and silently replaces it
+      if the server closed it, instead of failing the request.
+    * ``pool_use_lifo`` reuses the most recently returned connection first, so
+      under light load the same few warm connections serve every request and the
+      overflow ones are left idle long enough to be closed.
+    * ``pool_size``/``max_overflow`` size the pool per worker process,
+      ``pool_timeout`` bounds how long a request queues for a connection, and
+      ``pool_recycle`` retires connections before an idle timeout on the server
+      (or a proxy in front of it) can cut them.
+    """
+    if make_url(database_url).get_backend_name() == "sqlite":
+        return {}
+    return {
+        "pool_pre_ping": True,
+        "pool_use_lifo": pool_use_lifo,
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_timeout": pool_timeout,
+        "pool_recycle": pool_recycle,
+    }
+
+
 def create_app():
     """Application factory"""
     app = Flask(__name__)
@@ -50,6 +91,14 @@ def create_app():
     # Load configuration
     app.config["SQLALCHEMY_DATABASE_URI"] = Config.DATABASE_URL
     app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = engine_options(
+        Config.DATABASE_URL,
+        pool_use_lifo=Config.DB_POOL_USE_LIFO,
+        pool_size=Config.DB_POOL_SIZE,
+        max_overflow=Config.DB_MAX_OVERFLOW,
+        pool_timeout=Config.DB_POOL_TIMEOUT,
+        pool_recycle=Config.DB_POOL_RECYCLE,
+    )
     app.config["SECRET_KEY"] = resolve_secret_key(Config.SECRET_KEY, Config.DEBUG)
 
     # Harden the session cookie.
@@ -63,6 +112,7 @@ def create_app():
 
     # Initialize extensions
     db.init_app(app)
+    app.extensions["page_cache"] = TTLCache(Config.DASHBOARD_CACHE_SECONDS)
 
     # Register blueprints
     app.register_blueprint(main)
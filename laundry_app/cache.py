@@ -0,0 +1,53 @@
+"""A small per-process cache for read-heavy pages.
+
+The admin dashboard is polled far more often than the data behind it changes:
+laundry requests only move when a student submits or an admin updates a status.
+Rather than re-running the same queries on every refresh, the route keeps the
+query results here for a few seconds and drops them as soon as one of those two
+writes happens in this process.
+
+Framework-free on purpose -- the application stores one instance in
+``app.extensions`` (see ``app.create_app``), which keeps each app, and so each
+test, isolated from the next. With several worker processes a write in one
+worker is only seen by another once its copy expires, which is what bounds the
+staleness to ``ttl`` seconds.
+"""
+
+import time
+
+
+class TTLCache:
+    """A dict whose entries expire ``ttl`` seconds after they were stored.
+
+    ``ttl <= 0`` disables caching: :meth:`set` becomes a no-op, so every
+    :meth:`get` misses. ``clock`` exists so tests can drive time by hand.
+    """
+
+    def __init__(self, ttl, clock=time.monotonic):
+        self.ttl = ttl
+        self._clock = clock
+        self._entries = {}
+
+    def get(self, key):
+        """Return the live value stored under ``key``, or ``None``."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if self._clock() >= expires_at:
+            self._entries.pop(key, None)
+            return None
+        return value
+
+    def set(self, key, value):
+        """Store ``value`` under ``key`` for ``ttl`` seconds and return it."""
+        if self.ttl > 0:
+            self._entries[key] = (self._clock() + self.ttl, value)
+        return value
+
+    def invalidate(self, *keys):
+        """Drop the given keys, or everything when called with no arguments."""
+        if not keys:
+            self._entries.clear()
+        for key in keys:
+            self._entries.pop(key, None)
@@ -39,3 +39,24 @@ class Config:
 
     # App settings
     DEBUG = os.getenv("DEBUG", "False").lower() == "true"
+
+    # How long the admin dashboard may serve its query results from memory.
+    # Writes made through this process invalidate it immediately; the TTL only
+    # bounds how stale another worker process can be. 0 disables the cache.
+    DASHBOARD_CACHE_SECONDS = int(os.getenv("DASHBOARD_CACHE_SECONDS", "5"))
+
+    # Connection pool
+    #
+    # Hand out the most recently returned connection first, so a quiet app keeps
+    # reusing a few warm connections and the rest of the pool can time out.
+    # Only applies to server databases -- see ``app.engine_options``.
+    DB_POOL_USE_LIFO = os.getenv("DB_POOL_USE_LIFO", "True").lower() == "true"
+    # Per worker process: multiply by the gunicorn worker count and keep the
+    # total (pool size + overflow) under the server's max_connections.
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+    DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    # Seconds a request waits for a free connection before failing.
+    DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+    # Seconds after which a connection is replaced rather than reused, so it
+    # never outlives a server- or proxy-side idle timeout.
+    DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
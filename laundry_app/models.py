@@ -2,14 +2,44 @@
 Database models using SQLAlchemy
 """
 
-from datetime import datetime
-
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
 from werkzeug.security import check_password_hash, generate_password_hash
 
 db = SQLAlchemy()
 
 
+class UtcNow(FunctionElement):
+    """The current UTC time, evaluated by the database inside the statement.
+
+    Every timestamp column defaults to this, and ``services.requests.set_status``
+    stamps ``completed_date`` with it, so all of them come from the one database
+    clock rather than from each worker's own. The DateTime columns here are
+    naive UTC. SQLite's ``CURRENT_TIMESTAMP`` is UTC but whole seconds only, so
+    SQLite gets ``STRFTIME(... '%f' ...)`` for milliseconds instead;
+    PostgreSQL's follows the session time zone, so it is converted explicitly.
+    """
+
+    type = db.DateTime()
+    inherit_cache = True
+
+
+@compiles(UtcNow)
+def _compile_utcnow(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(UtcNow, "sqlite")
+def _compile_utcnow_sqlite(element, compiler, **kw):
+    return "STRFTIME('%Y-%m-%d %H:%M:%f', 'now')"
+
+
+@compiles(UtcNow, "postgresql")
+def _compile_utcnow_postgresql(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
 class Student(db.Model):
     """Student model - users who submit laundry requests"""
 
@@ -20,7 +50,7 @@ class Student(db.Model):
     name = db.Column(db.String(100), nullable=False)
     password_hash = db.Column(db.String(255), nullable=False)
     remaining_quota = db.Column(db.Integer, default=30)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, default=UtcNow())
 
     # Relationship
     laundry_requests = db.relationship("LaundryRequest", backref="student", lazy=True)
@@ -39,6 +69,37 @@ class LaundryRequest(db.Model):
     """Laundry request model - tracks laundry jobs"""
 
     __tablename__ = "laundry_requests"
+    __table_args__ = (
+        # db.create_all() only builds indexes for new tables -- existing
+        # databases need the CREATE INDEX statements in the README.
+        #
+        # The admin dashboard's running board: status IN (...) ORDER BY
+        # submission_date. The index narrows the scan to the active jobs; the
+        # IN spans two statuses, so the rows still need a (small) sort. On
+        # PostgreSQL the INCLUDE columns cover the rest of routes._RUNNING_JOBS,
+        # which allows an index-only scan. SQLite has no INCLUDE and may just as
+        # well seek on the status-led index below.
+        db.Index(
+            "ix_laundry_requests_status_submission_date",
+            "status",
+            "submission_date",
+            postgresql_include=["id", "student_id", "num_clothes"],
+        ),
+        # A student's history: student_id = ? ORDER BY submission_date DESC.
+        # Also serves the students directory's join on student_id.
+        db.Index(
+            "ix_laundry_requests_student_id_submission_date",
+            "student_id",
+            "submission_date",
+        ),
+        # The admin dashboard's recently completed list: status = 'completed'
+        # ORDER BY completed_date DESC LIMIT 20, read straight off the index.
+        db.Index(
+            "ix_laundry_requests_status_completed_date",
+            "status",
+            "completed_date",
+        ),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     student_id = db.Column(db.String(20), db.ForeignKey("students.student_id"), nullable=False)
@@ -46,7 +107,7 @@ class LaundryRequest(db.Model):
     status = db.Column(
         db.String(20), default="submitted"
     )  # submitted, processing, completed, cancelled
-    submission_date = db.Column(db.DateTime, default=datetime.utcnow)
+    submission_date = db.Column(db.DateTime, default=UtcNow())
     completed_date = db.Column(db.DateTime, nullable=True)
 
     def __repr__(self):
@@ -61,7 +122,7 @@ class Admin(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String(50), unique=True, nullable=False)
     password_hash = db.Column(db.String(255), nullable=False)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, default=UtcNow())
 
     def set_password(self, password):
         self.password_hash = generate_password_hash(password)
@@ -8,8 +8,19 @@ redirect. The rules themselves live in ``laundry_app/services/``.
 
 from functools import wraps
 
-from flask import Blueprint, flash, g, redirect, render_template, request, session, url_for
-from sqlalchemy import func
+from flask import (
+    Blueprint,
+    current_app,
+    flash,
+    g,
+    make_response,
+    redirect,
+    render_template,
+    request,
+    session,
+    url_for,
+)
+from sqlalchemy import func, select
 
 from models import Admin, LaundryRequest, Student, db
 from services import quota as quota_service
@@ -21,6 +32,14 @@ auth = Blueprint("auth", __name__)
 student = Blueprint("student", __name__, url_prefix="/student")
 admin = Blueprint("admin", __name__, url_prefix="/admin")
 
+# Key for the admin dashboard's query results in the page cache.
+ADMIN_DASHBOARD_CACHE_KEY = "admin.dashboard"
+
+
+def _page_cache():
+    """The app's :class:`cache.TTLCache`, created in ``app.create_app``."""
+    return current_app.extensions["page_cache"]
+
 
 # =====================================================
 # DECORATORS
@@ -84,6 +103,23 @@ def admin_required(f):
     return decorated_function
 
 
+def _revalidated(page):
+    """Wrap a rendered page so an unchanged copy costs the client only a 304.
+
+    The page is still rendered, but it carries an ETag of its body, and a
+    request whose ``If-None-Match`` matches gets ``304 Not Modified`` with no
+    body. ``no-cache`` -- revalidate every time -- rather than a ``max-age``:
+    the dashboards are the redirect target after every write, and a browser
+    serving a still-fresh copy would hide the change and its flash message.
+    ``private`` keeps shared proxies from storing a signed-in page at all.
+    """
+    response = make_response(page)
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    response.add_etag()
+    return response.make_conditional(request)
+
+
 # =====================================================
 # MAIN ROUTES
 # =====================================================
@@ -174,7 +210,7 @@ def dashboard():
         .all()
     )
 
-    return render_template("dashboard.html", student=student, requests=requests)
+    return _revalidated(render_template("dashboard.html", student=student, requests=requests))
 
 
 @student.route("/submit", methods=["POST"])
@@ -194,6 +230,8 @@ def submit_request():
         flash(f"You only have {exc.remaining} clothes remaining in your quota.", "error")
         return redirect(url_for("student.dashboard"))
 
+    _page_cache().invalidate(ADMIN_DASHBOARD_CACHE_KEY)
+
     flash(f"Request submitted for {num_clothes} clothes!", "success")
     return redirect(url_for("student.dashboard"))
 
@@ -203,54 +241,99 @@ def submit_request():
 # =====================================================
 
 
+def _count_with_status(status):
+    """``COUNT(...) FILTER (WHERE status = :status)``, labelled with the status."""
+    return func.count(LaundryRequest.id).filter(LaundryRequest.status == status).label(status)
+
+
+# The admin queries take no parameters, so they are built once at import rather
+# than on every request; SQLAlchemy then finds their compiled SQL in its cache
+# straight away.
+#
+# The job lists select exactly the columns their table in admin.html reads.
+# Skipping whole LaundryRequest entities saves identity-map and attribute
+# bookkeeping for every row, and leaves the page cache holding plain rows that
+# are tied to no session. The running board's columns are all in
+# ix_laundry_requests_status_submission_date (see models.LaundryRequest), so
+# PostgreSQL can answer it from the index alone; keep the two in step.
+_RUNNING_JOB_COLUMNS = (
+    LaundryRequest.id,
+    LaundryRequest.student_id,
+    LaundryRequest.num_clothes,
+    LaundryRequest.status,
+    LaundryRequest.submission_date,
+)
+
+_COMPLETED_JOB_COLUMNS = (
+    LaundryRequest.id,
+    LaundryRequest.student_id,
+    LaundryRequest.num_clothes,
+    LaundryRequest.submission_date,
+    LaundryRequest.completed_date,
+)
+
+_RUNNING_JOBS = (
+    select(*_RUNNING_JOB_COLUMNS)
+    .where(LaundryRequest.status.in_(["submitted", "processing"]))
+    .order_by(LaundryRequest.submission_date.desc())
+)
+
+_RECENTLY_COMPLETED_JOBS = (
+    select(*_COMPLETED_JOB_COLUMNS)
+    .where(LaundryRequest.status == "completed")
+    .order_by(LaundryRequest.completed_date.desc())
+    .limit(20)
+)
+
+# One round trip for all four stat cards. The per-status figures are conditional
+# counts over a single scan of laundry_requests, and the student total rides
+# along as a scalar subquery.
+_DASHBOARD_STATS = select(
+    _count_with_status("submitted"),
+    _count_with_status("processing"),
+    _count_with_status("completed"),
+    select(func.count(Student.id)).scalar_subquery().label("total_students"),
+)
+
+# One grouped query for the per-student counts instead of two queries per row.
+# The outer join keeps students who have never submitted anything.
+_STUDENT_DIRECTORY = (
+    select(
+        Student,
+        func.count(LaundryRequest.id).label("total_requests"),
+        func.coalesce(func.sum(LaundryRequest.num_clothes), 0).label("total_clothes"),
+    )
+    .outerjoin(LaundryRequest, LaundryRequest.student_id == Student.student_id)
+    .group_by(Student.id)
+    .order_by(Student.name)
+)
+
+
 @admin.route("/dashboard")
 @admin_required
 def dashboard():
     """Admin dashboard - view all running jobs"""
-    # Get jobs grouped by status
-    running_jobs = (
-        LaundryRequest.query.filter(LaundryRequest.status.in_(["submitted", "processing"]))
-        .order_by(LaundryRequest.submission_date.desc())
-        .all()
-    )
+    data = _page_cache().get(ADMIN_DASHBOARD_CACHE_KEY)
+    if data is None:
+        data = _page_cache().set(ADMIN_DASHBOARD_CACHE_KEY, _admin_dashboard_data())
 
-    completed_jobs = (
-        LaundryRequest.query.filter_by(status="completed")
-        .order_by(LaundryRequest.completed_date.desc())
-        .limit(20)
-        .all()
-    )
+    return _revalidated(render_template("admin.html", **data))
 
-    # Stats
-    stats = {
-        "submitted": LaundryRequest.query.filter_by(status="submitted").count(),
-        "processing": LaundryRequest.query.filter_by(status="processing").count(),
-        "completed": LaundryRequest.query.filter_by(status="completed").count(),
-        "total_students": Student.query.count(),
-    }
 
-    return render_template(
-        "admin.html", running_jobs=running_jobs, completed_jobs=completed_jobs, stats=stats
-    )
+def _admin_dashboard_data():
+    """Query everything the admin dashboard renders."""
+    return {
+        "running_jobs": db.session.execute(_RUNNING_JOBS).all(),
+        "completed_jobs": db.session.execute(_RECENTLY_COMPLETED_JOBS).all(),
+        "stats": db.session.execute(_DASHBOARD_STATS).one()._asdict(),
+    }
 
 
 @admin.route("/students")
 @admin_required
 def students():
     """Directory of enrolled students, with their laundry activity."""
-    # One grouped query for the per-student counts instead of two queries per
-    # row. `outerjoin` keeps students who have never submitted anything.
-    rows = (
-        db.session.query(
-            Student,
-            func.count(LaundryRequest.id).label("total_requests"),
-            func.coalesce(func.sum(LaundryRequest.num_clothes), 0).label("total_clothes"),
-        )
-        .outerjoin(LaundryRequest, LaundryRequest.student_id == Student.student_id)
-        .group_by(Student.id)
-        .order_by(Student.name)
-        .all()
-    )
+    rows = db.session.execute(_STUDENT_DIRECTORY).all()
 
     students_list = [
         {
@@ -273,6 +356,7 @@ def update_status(request_id):
     laundry_request = LaundryRequest.query.get_or_404(request_id)
 
     requests_service.set_status(db.session, laundry_request, new_status)
+    _page_cache().invalidate(ADMIN_DASHBOARD_CACHE_KEY)
 
     flash(f"Job #{request_id} status updated to {new_status}.", "success")
     return redirect(url_for("admin.dashboard"))
@@ -16,6 +16,9 @@ import re
 import unicodedata
 from datetime import UTC, datetime, timedelta
 
+from sqlalchemy import insert, select
+from werkzeug.security import generate_password_hash
+
 from app import create_app
 from models import LaundryRequest, Student, db
 
@@ -50,11 +53,14 @@ DEMO_STUDENTS = [
 _STATUS_MIX = ["submitted"] * 4 + ["processing"] * 3 + ["completed"] * 6 + ["cancelled"] * 1
 
 
+_NON_LETTERS = re.compile(r"[^a-z]")
+
+
 def _ascii_letters(text):
     """Strip accents and anything that is not a letter: 'La Cerva' -> 'lacerva'."""
     decomposed = unicodedata.normalize("NFKD", text)
     stripped = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
-    return re.sub(r"[^a-z]", "", stripped.lower())
+    return _NON_LETTERS.sub("", stripped.lower())
 
 
 def derive_username(full_name, taken=()):
@@ -82,7 +88,7 @@ def derive_username(full_name, taken=()):
 
 
 def _make_history(rng, student_id, now):
-    """Build a plausible request history for one student."""
+    """Build a plausible request history for one student, as insert parameters."""
     requests = []
     for _ in range(rng.randint(0, 4)):
         status = rng.choice(_STATUS_MIX)
@@ -91,13 +97,13 @@ def _make_history(rng, student_id, now):
         if status == "completed":
             completed = submitted + timedelta(hours=rng.randint(6, 72))
         requests.append(
-            LaundryRequest(
-                student_id=student_id,
-                num_clothes=rng.randint(1, 9),
-                status=status,
-                submission_date=submitted,
-                completed_date=completed,
-            )
+            {
+                "student_id": student_id,
+                "num_clothes": rng.randint(1, 9),
+                "status": status,
+                "submission_date": submitted,
+                "completed_date": completed,
+            }
         )
     return requests
 
@@ -111,29 +117,44 @@ def seed(app):
     with app.app_context():
         db.create_all()
 
-        taken = {s.student_id for s in Student.query.all()}
-        added, skipped, requests_added = 0, 0, 0
+        # One query tells us both which handles are taken and who is present.
+        existing = db.session.execute(select(Student.student_id, Student.name)).all()
+        taken = {student_id for student_id, _ in existing}
+        present = {name for _, name in existing}
+
+        # Every demo account shares one password, so pay for the deliberately
+        # slow hash once instead of once per student.
+        password_hash = generate_password_hash(DEMO_PASSWORD)
+
+        students, requests, skipped = [], [], 0
 
         for name, quota in DEMO_STUDENTS:
             username = derive_username(name, taken)
-            if Student.query.filter_by(name=name).first():
+            if name in present:
                 skipped += 1
                 continue
 
             taken.add(username)
-            student = Student(student_id=username, name=name, remaining_quota=quota)
-            student.set_password(DEMO_PASSWORD)
-            db.session.add(student)
-
-            history = _make_history(rng, username, now)
-            db.session.add_all(history)
-            requests_added += len(history)
-            added += 1
-
+            students.append(
+                {
+                    "student_id": username,
+                    "name": name,
+                    "password_hash": password_hash,
+                    "remaining_quota": quota,
+                }
+            )
+            requests.extend(_make_history(rng, username, now))
+
+        # One multi-row INSERT per table rather than a row-by-row flush. Only
+        # the handle links a request to its student, so no ids need reading back.
+        if students:
+            db.session.execute(insert(Student), students)
+        if requests:
+            db.session.execute(insert(LaundryRequest), requests)
         db.session.commit()
 
-    print(f"Added {added} demo students ({skipped} already present).")
-    print(f"Added {requests_added} laundry requests.")
+    print(f"Added {len(students)} demo students ({skipped} already present).")
+    print(f"Added {len(requests)} laundry requests.")
     print(f"All demo accounts use the password: {DEMO_PASSWORD}")
 
 
@@ -1,7 +1,10 @@
-"""Quota arithmetic and the validation that guards it.
+"""Validation of a requested number of clothes against a student's quota.
 
-Extracted verbatim from the body of ``routes.submit_request``. The behaviour --
-including its known defects -- is unchanged; only the location moved.
+Extracted from the body of ``routes.submit_request``. The quantity parsing and
+the checks behave as they did inline -- including their known defects. The
+deduction itself is no longer here: ``services.requests.submit`` performs it as
+one conditional UPDATE so that the database, not a stale in-memory balance,
+decides whether the quota still covers the request.
 """
 
 
@@ -50,13 +53,3 @@ def check(student, num_clothes):
 
     if num_clothes > student.remaining_quota:
         raise QuotaExceeded(num_clothes, student.remaining_quota)
-
-
-def deduct(student, num_clothes):
-    """Subtract ``num_clothes`` from the student's remaining quota (in memory).
-
-    Persisting the change is the caller's responsibility -- this function never
-    commits.
-    """
-    student.remaining_quota -= num_clothes
-    return student.remaining_quota
@@ -1,13 +1,14 @@
 """Creating laundry requests and moving them between statuses.
 
-Extracted verbatim from ``routes.submit_request`` and ``routes.update_status``.
-Both functions take the SQLAlchemy session explicitly so they can run against a
+Extracted from ``routes.submit_request`` and ``routes.update_status``. Both
+functions take the SQLAlchemy session explicitly so they can run against a
 plain ``sessionmaker()`` session with no Flask application in sight.
 """
 
-from datetime import datetime
+from sqlalchemy import update
+from sqlalchemy.orm.attributes import set_committed_value
 
-from models import LaundryRequest
+from models import LaundryRequest, Student, UtcNow
 from services import quota
 
 COMPLETED = "completed"
@@ -18,17 +19,37 @@ def submit(db_session, student, num_clothes):
 
     Returns the persisted :class:`~models.LaundryRequest`. Raises
     :class:`~services.quota.InvalidQuantity` or
-    :class:`~services.quota.QuotaExceeded` -- and leaves the session untouched
+    :class:`~services.quota.QuotaExceeded` -- and adds nothing to the session
     -- when validation fails.
 
-    The step order is load-bearing and matches the original inline code:
-    validate, build the row, deduct, then a single commit.
+    The deduction is a single conditional ``UPDATE ... WHERE remaining_quota >=
+    :n RETURNING remaining_quota``, so the database decides whether the quota
+    still covers the request. Two concurrent submissions can no longer both pass
+    the check and drive the balance negative: the loser's UPDATE matches no row
+    and it gets :class:`~services.quota.QuotaExceeded` with the balance the
+    winner left behind. :func:`~services.quota.check` still runs first so the
+    common rejections never reach the database.
     """
     quota.check(student, num_clothes)
 
-    laundry_request = LaundryRequest(student_id=student.student_id, num_clothes=num_clothes)
-    quota.deduct(student, num_clothes)
+    remaining = db_session.execute(
+        update(Student)
+        .where(Student.id == student.id, Student.remaining_quota >= num_clothes)
+        .values(remaining_quota=Student.remaining_quota - num_clothes)
+        .returning(Student.remaining_quota)
+        .execution_options(synchronize_session=False)
+    ).scalar_one_or_none()
+
+    if remaining is None:
+        # Someone else spent the quota after ``student`` was loaded.
+        db_session.refresh(student, ["remaining_quota"])
+        raise quota.QuotaExceeded(num_clothes, student.remaining_quota)
 
+    # Mirror the new balance onto the loaded object without marking it dirty;
+    # the UPDATE above already wrote it.
+    set_committed_value(student, "remaining_quota", remaining)
+
+    laundry_request = LaundryRequest(student_id=student.student_id, num_clothes=num_clothes)
     db_session.add(laundry_request)
     db_session.commit()
 
@@ -41,15 +62,16 @@ def set_status(db_session, laundry_request, new_status, now=None):
     ``completed_date`` is stamped only when ``new_status`` is exactly
     ``"completed"``; the comparison is case-sensitive and there is no allowlist
     of valid statuses, both of which are the pre-existing behaviour. ``now``
-    exists so tests can pin the timestamp -- omitted, it is ``utcnow()``, which
-    is what the route always used.
+    exists so tests can pin the timestamp -- omitted, the database stamps its
+    own UTC clock (:class:`~models.UtcNow`) inside the UPDATE, so every worker
+    agrees on one clock and no datetime is built in Python.
 
     Returns the same request object.
     """
     laundry_request.status = new_status
 
     if new_status == COMPLETED:
-        laundry_request.completed_date = now if now is not None else datetime.utcnow()
+        laundry_request.completed_date = now if now is not None else UtcNow()
 
     db_session.commit()
 
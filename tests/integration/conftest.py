@@ -17,6 +17,7 @@ construction would be too late for the database URL.
 """
 
 import pytest
+from sqlalchemy import event
 
 from app import create_app
 from config import Config
@@ -85,6 +86,26 @@ def db_session(app):
     return _db.session
 
 
+@pytest.fixture
+def captured_sql(app):
+    """Every SQL statement the app's engine executes, in order.
+
+    Only statements issued after the fixture is first requested are recorded,
+    so set up data before asking for it (or ``clear()`` it) when a test is
+    counting the queries behind a single request.
+    """
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(_db.engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(_db.engine, "before_cursor_execute", _record)
+
+
 # ---------------------------------------------------------------------------
 # Factory fixtures
 # ---------------------------------------------------------------------------
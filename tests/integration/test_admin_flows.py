@@ -9,7 +9,12 @@ two roles actually meet in the same database.
 import re
 from datetime import datetime
 
-from models import LaundryRequest
+from sqlalchemy import text
+from sqlalchemy.dialects import sqlite
+
+import routes
+from cache import TTLCache
+from models import LaundryRequest, db
 
 PROTECTED_ROUTES = [("GET", "/admin/dashboard"), ("POST", "/admin/update-status/1")]
 
@@ -103,6 +108,95 @@ def test_an_empty_dashboard_renders_its_empty_states(admin_client):
     }
 
 
+def test_the_stat_cards_cost_a_single_query(admin_client, make_student, make_request, captured_sql):
+    make_student(student_id="STU001")
+    make_request(student_id="STU001", status="submitted")
+    captured_sql.clear()
+
+    admin_client.get("/admin/dashboard")
+
+    assert len([sql for sql in captured_sql if "count(" in sql]) == 1
+
+
+def _job_queries(statements):
+    return [sql for sql in statements if "FROM laundry_requests" in sql]
+
+
+def test_a_repeat_view_is_served_from_the_page_cache(admin_client, make_request, captured_sql):
+    make_request(student_id="STU001", status="submitted")
+    first = admin_client.get("/admin/dashboard").get_data(as_text=True)
+    captured_sql.clear()
+
+    second = admin_client.get("/admin/dashboard").get_data(as_text=True)
+
+    assert _job_queries(captured_sql) == []
+    assert _job_ids_in(second, "running") == _job_ids_in(first, "running")
+
+
+def test_the_page_cache_holds_plain_rows_not_entities(app, admin_client, make_request):
+    make_request(student_id="STU001", status="submitted")
+    make_request(student_id="STU001", status="completed", completed_date=datetime(2026, 1, 1))
+    admin_client.get("/admin/dashboard")
+
+    cached = app.extensions["page_cache"].get("admin.dashboard")
+    jobs = cached["running_jobs"] + cached["completed_jobs"]
+    assert len(jobs) == 2
+    assert not any(isinstance(job, LaundryRequest) for job in jobs)
+
+
+def test_the_page_cache_is_bounded_by_its_ttl(app, admin_client, make_request):
+    """A write that bypasses the routes (another worker) shows up once the TTL lapses."""
+    clock = [0.0]
+    app.extensions["page_cache"] = TTLCache(ttl=5, clock=lambda: clock[0])
+    admin_client.get("/admin/dashboard")
+    job = make_request(student_id="STU001", status="submitted")
+
+    stale = admin_client.get("/admin/dashboard").get_data(as_text=True)
+    assert _job_ids_in(stale, "running") == []
+
+    clock[0] += 5
+    fresh = admin_client.get("/admin/dashboard").get_data(as_text=True)
+    assert _job_ids_in(fresh, "running") == [job.id]
+
+
+def test_a_student_submission_invalidates_the_page_cache(app, admin_client, student_user):
+    admin_client.get("/admin/dashboard")
+
+    student_client = app.test_client()
+    student_client.post("/login", data={"student_id": "STU001", "password": "password123"})
+    student_client.post("/student/submit", data={"num_clothes": "3"})
+
+    body = admin_client.get("/admin/dashboard").get_data(as_text=True)
+    assert len(_job_ids_in(body, "running")) == 1
+
+
+def test_a_status_update_invalidates_the_page_cache(admin_client, make_request):
+    job = make_request(student_id="STU001", status="submitted")
+    admin_client.get("/admin/dashboard")
+
+    admin_client.post(f"/admin/update-status/{job.id}", data={"status": "completed"})
+
+    body = admin_client.get("/admin/dashboard").get_data(as_text=True)
+    assert _job_ids_in(body, "running") == []
+    assert _job_ids_in(body, "completed") == [job.id]
+
+
+def test_an_unchanged_admin_dashboard_is_a_bodyless_304(admin_client, make_request):
+    job = make_request(student_id="STU001", status="submitted")
+    admin_client.get("/admin/dashboard")  # consumes the login's "Welcome" flash
+    first = admin_client.get("/admin/dashboard")
+    assert "no-cache" in first.headers["Cache-Control"]
+
+    unchanged = admin_client.get(
+        "/admin/dashboard", headers={"If-None-Match": first.headers["ETag"]}
+    )
+    assert unchanged.status_code == 304
+
+    admin_client.post(f"/admin/update-status/{job.id}", data={"status": "processing"})
+    changed = admin_client.get("/admin/dashboard", headers={"If-None-Match": first.headers["ETag"]})
+    assert changed.status_code == 200
+
+
 def test_updating_a_job_persists_and_flashes_a_confirmation(admin_client, make_request, db_session):
     job = make_request(student_id="STU001", num_clothes=5, status="submitted")
 
@@ -157,3 +251,38 @@ def test_a_student_submission_travels_all_the_way_to_an_admin_completion(
     assert f">#{job.id}</td>" in student_view
     assert "bg-green-100 text-green-800" in student_view, "the row must render as completed"
     assert "23" in student_view, "the quota stays spent -- completion is not a refund"
+
+
+# ---------------------------------------------------------------------------
+# The running board's query and its index
+# ---------------------------------------------------------------------------
+
+
+def test_the_running_board_query_searches_a_status_index(app):
+    """The statement the route really sends seeks on status instead of scanning.
+
+    Both status-led indexes narrow it equally, and SQLite is free to pick
+    either; the two-status IN still leaves a sort, which this does not hide.
+    """
+    sql = routes._RUNNING_JOBS.compile(
+        dialect=sqlite.dialect(), compile_kwargs={"literal_binds": True}
+    )
+    with app.app_context():
+        plan = [row[-1] for row in db.session.execute(text(f"EXPLAIN QUERY PLAN {sql}"))]
+    assert any(
+        step.startswith("SEARCH laundry_requests USING INDEX ix_laundry_requests_status_")
+        and "(status=?)" in step
+        for step in plan
+    )
+    assert "USE TEMP B-TREE FOR ORDER BY" in plan
+
+
+def test_the_running_board_reads_only_columns_its_index_covers_on_postgresql():
+    index = next(
+        ix
+        for ix in LaundryRequest.__table__.indexes
+        if ix.name == "ix_laundry_requests_status_submission_date"
+    )
+    covered = {column.name for column in index.columns}
+    covered.update(index.dialect_options["postgresql"]["include"])
+    assert {column.name for column in routes._RUNNING_JOBS.selected_columns} <= covered
@@ -7,8 +7,9 @@ fixture forbids that by design. They do no HTTP, so they stay fast.
 
 import pytest
 from flask import Flask
+from sqlalchemy import create_engine
 
-from app import create_app, init_db
+from app import create_app, engine_options, init_db
 from config import Config
 from models import Admin, LaundryRequest, Student
 from models import db as _db
@@ -57,6 +58,49 @@ class TestCreateApp:
         second = create_app()
         assert second is not app
 
+    def test_sqlite_gets_no_engine_tuning(self, app):
+        assert app.config["SQLALCHEMY_ENGINE_OPTIONS"] == {}
+
+
+class TestEngineOptions:
+    @pytest.mark.parametrize(
+        "url", ["sqlite:///:memory:", "sqlite:///laundry.db", "sqlite+pysqlite:///x.db"]
+    )
+    def test_sqlite_is_left_alone(self, url):
+        assert engine_options(url) == {}
+
+    def test_a_server_database_pings_and_reuses_warm_connections(self):
+        options = engine_options("postgresql://user:pw@localhost/laundry")
+        assert options["pool_pre_ping"] is True
+        assert options["pool_use_lifo"] is True
+
+    def test_a_server_database_gets_a_sized_pool(self):
+        options = engine_options(
+            "postgresql://user:pw@localhost/laundry",
+            pool_size=20,
+            max_overflow=5,
+            pool_timeout=7,
+            pool_recycle=900,
+        )
+        assert options["pool_size"] == 20
+        assert options["max_overflow"] == 5
+        assert options["pool_timeout"] == 7
+        assert options["pool_recycle"] == 900
+
+    def test_the_options_are_valid_queuepool_arguments(self, tmp_path):
+        # No PostgreSQL driver is needed to check the keyword names: a file
+        # SQLite database also gets a QueuePool, which rejects unknown ones.
+        options = engine_options("postgresql://user:pw@localhost/laundry")
+        engine = create_engine(f"sqlite:///{tmp_path / 'pool.db'}", **options)
+        try:
+            assert engine.pool.size() == options["pool_size"]
+        finally:
+            engine.dispose()
+
+    def test_lifo_checkout_can_be_turned_off(self):
+        options = engine_options("postgresql://user:pw@localhost/laundry", pool_use_lifo=False)
+        assert options["pool_use_lifo"] is False
+
 
 class TestInitDb:
     def test_creates_the_schema_and_seeds(self, bare_app):
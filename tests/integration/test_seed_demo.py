@@ -39,6 +39,11 @@ class TestSeeding:
             for student in Student.query.all():
                 assert student.password_hash != DEMO_PASSWORD
 
+    def test_bulk_inserted_students_still_get_created_at(self, bare_app):
+        seed(bare_app)
+        with bare_app.app_context():
+            assert all(s.created_at is not None for s in Student.query.all())
+
     def test_quotas_match_the_table(self, bare_app):
         seed(bare_app)
         with bare_app.app_context():
@@ -96,3 +96,31 @@ def test_submitting_a_non_positive_quantity_is_rejected(student_client, db_sessi
     assert "bg-red-50" in body
     assert db_session.query(LaundryRequest).count() == 0
     assert db_session.query(Student).filter_by(student_id="STU001").one().remaining_quota == 30
+
+
+def test_the_dashboard_is_revalidated_not_cached(student_client):
+    resp = student_client.get("/student/dashboard")
+    assert resp.headers["ETag"]
+    assert "no-cache" in resp.headers["Cache-Control"]
+    assert "private" in resp.headers["Cache-Control"]
+
+
+def test_an_unchanged_dashboard_is_a_bodyless_304(student_client):
+    student_client.get("/student/dashboard")  # consumes the login's "Welcome back!" flash
+    etag = student_client.get("/student/dashboard").headers["ETag"]
+
+    resp = student_client.get("/student/dashboard", headers={"If-None-Match": etag})
+
+    assert resp.status_code == 304
+    assert resp.get_data() == b""
+
+
+def test_a_submission_changes_the_etag(student_client):
+    etag = student_client.get("/student/dashboard").headers["ETag"]
+    student_client.post("/student/submit", data={"num_clothes": "2"})
+
+    resp = student_client.get("/student/dashboard", headers={"If-None-Match": etag})
+
+    assert resp.status_code == 200
+    assert resp.headers["ETag"] != etag
+    assert "Request submitted for 2 clothes!" in resp.get_data(as_text=True)
@@ -137,9 +137,8 @@ def student(make_student):
 class FakeStudent:
     """A stand-in for a Student that never touches a database.
 
-    ``quota.check`` and ``quota.deduct`` only read and write
-    ``remaining_quota``, so most of the quota tests need nothing more than
-    this. Using it keeps those tests honest about the service's real dependency
+    ``quota.check`` only reads ``remaining_quota``, so most of the quota tests
+    need nothing more than this. Using it keeps those tests honest about the service's real dependency
     surface.
     """
 
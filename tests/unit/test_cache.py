@@ -0,0 +1,103 @@
+"""Tests for cache.py -- the per-process TTL cache behind the admin dashboard.
+
+Time is driven by hand through the ``clock`` argument, so nothing here sleeps.
+"""
+
+import pytest
+
+from cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock):
+    return TTLCache(ttl=5, clock=clock)
+
+
+class TestGetAndSet:
+    def test_a_missing_key_misses(self, cache):
+        assert cache.get("k") is None
+
+    def test_a_stored_value_is_returned(self, cache):
+        cache.set("k", {"a": 1})
+        assert cache.get("k") == {"a": 1}
+
+    def test_set_returns_the_value_it_stored(self, cache):
+        value = ["x"]
+        assert cache.set("k", value) is value
+
+    def test_the_same_object_comes_back(self, cache):
+        value = ["x"]
+        cache.set("k", value)
+        assert cache.get("k") is value
+
+    def test_keys_are_independent(self, cache):
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert (cache.get("a"), cache.get("b")) == (1, 2)
+
+    def test_setting_again_replaces_the_value(self, cache):
+        cache.set("k", 1)
+        cache.set("k", 2)
+        assert cache.get("k") == 2
+
+
+class TestExpiry:
+    def test_a_value_is_live_just_before_the_ttl(self, cache, clock):
+        cache.set("k", 1)
+        clock.now += 4.999
+        assert cache.get("k") == 1
+
+    def test_a_value_expires_at_the_ttl(self, cache, clock):
+        cache.set("k", 1)
+        clock.now += 5
+        assert cache.get("k") is None
+
+    def test_resetting_restarts_the_ttl(self, cache, clock):
+        cache.set("k", 1)
+        clock.now += 4
+        cache.set("k", 2)
+        clock.now += 4
+        assert cache.get("k") == 2
+
+    @pytest.mark.parametrize("ttl", [0, -1])
+    def test_a_non_positive_ttl_disables_the_cache(self, clock, ttl):
+        cache = TTLCache(ttl=ttl, clock=clock)
+        assert cache.set("k", 1) == 1
+        assert cache.get("k") is None
+
+
+class TestInvalidate:
+    def test_invalidating_a_key_drops_only_that_key(self, cache):
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.invalidate("a")
+        assert (cache.get("a"), cache.get("b")) == (None, 2)
+
+    def test_invalidating_an_unknown_key_is_harmless(self, cache):
+        cache.invalidate("nope")
+        assert cache.get("nope") is None
+
+    def test_invalidating_with_no_keys_clears_everything(self, cache):
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.invalidate()
+        assert (cache.get("a"), cache.get("b")) == (None, None)
+
+
+def test_the_cache_module_imports_no_flask(imported_roots):
+    import cache as cache_module
+
+    assert "flask" not in imported_roots(cache_module)
@@ -18,7 +18,17 @@ import pytest
 
 import config as config_module
 
-ENV_KEYS = ("DATABASE_URL", "SECRET_KEY", "DEBUG")
+ENV_KEYS = (
+    "DATABASE_URL",
+    "SECRET_KEY",
+    "DEBUG",
+    "DASHBOARD_CACHE_SECONDS",
+    "DB_POOL_USE_LIFO",
+    "DB_POOL_SIZE",
+    "DB_MAX_OVERFLOW",
+    "DB_POOL_TIMEOUT",
+    "DB_POOL_RECYCLE",
+)
 
 
 @pytest.fixture
@@ -149,6 +159,45 @@ class TestDebugParsing:
         assert isinstance(cfg.DEBUG, bool)
 
 
+# ---------------------------------------------------------------------------
+# Dashboard cache
+# ---------------------------------------------------------------------------
+
+
+class TestDashboardCacheSettings:
+    def test_defaults_to_five_seconds(self, reload_config):
+        assert reload_config().DASHBOARD_CACHE_SECONDS == 5
+
+    def test_read_from_env_as_an_int(self, reload_config):
+        assert reload_config(DASHBOARD_CACHE_SECONDS="0").DASHBOARD_CACHE_SECONDS == 0
+
+
+# ---------------------------------------------------------------------------
+# Connection pool
+# ---------------------------------------------------------------------------
+
+
+class TestPoolSettings:
+    def test_lifo_checkout_is_on_by_default(self, reload_config):
+        assert reload_config().DB_POOL_USE_LIFO is True
+
+    @pytest.mark.parametrize("raw", ["false", "False", "0"])
+    def test_lifo_checkout_can_be_turned_off(self, reload_config, raw):
+        assert reload_config(DB_POOL_USE_LIFO=raw).DB_POOL_USE_LIFO is False
+
+    def test_pool_sizing_defaults(self, reload_config):
+        cfg = reload_config()
+        assert (cfg.DB_POOL_SIZE, cfg.DB_MAX_OVERFLOW) == (10, 10)
+        assert (cfg.DB_POOL_TIMEOUT, cfg.DB_POOL_RECYCLE) == (30, 1800)
+
+    def test_pool_sizing_from_env(self, reload_config):
+        cfg = reload_config(
+            DB_POOL_SIZE="20", DB_MAX_OVERFLOW="0", DB_POOL_TIMEOUT="5", DB_POOL_RECYCLE="600"
+        )
+        assert (cfg.DB_POOL_SIZE, cfg.DB_MAX_OVERFLOW) == (20, 0)
+        assert (cfg.DB_POOL_TIMEOUT, cfg.DB_POOL_RECYCLE) == (5, 600)
+
+
 # ---------------------------------------------------------------------------
 # Module shape
 # ---------------------------------------------------------------------------
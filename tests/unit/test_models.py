@@ -9,9 +9,11 @@ Flask-SQLAlchemy that requires an app context) is never used here.
 from datetime import datetime, timedelta
 
 import pytest
+from sqlalchemy import inspect, select, text
+from sqlalchemy.dialects import mysql, postgresql, sqlite
 from sqlalchemy.exc import IntegrityError
 
-from models import Admin, LaundryRequest, Student, db
+from models import Admin, LaundryRequest, Student, UtcNow, db
 
 # ---------------------------------------------------------------------------
 # Student password handling
@@ -323,3 +325,82 @@ def test_table_names():
     assert Admin.__tablename__ == "admins"
     assert LaundryRequest.__tablename__ == "laundry_requests"
     assert set(db.metadata.tables) == {"students", "admins", "laundry_requests"}
+
+
+# ---------------------------------------------------------------------------
+# Indexes
+# ---------------------------------------------------------------------------
+
+
+def _indexes(engine, table):
+    return {ix["name"]: ix["column_names"] for ix in inspect(engine).get_indexes(table)}
+
+
+class TestIndexes:
+    def test_running_board_index_is_created(self, engine):
+        assert _indexes(engine, "laundry_requests")[
+            "ix_laundry_requests_status_submission_date"
+        ] == ["status", "submission_date"]
+
+    def test_history_index_is_created(self, engine):
+        assert _indexes(engine, "laundry_requests")[
+            "ix_laundry_requests_student_id_submission_date"
+        ] == ["student_id", "submission_date"]
+
+    def test_completed_list_index_is_created(self, engine):
+        assert _indexes(engine, "laundry_requests")[
+            "ix_laundry_requests_status_completed_date"
+        ] == ["status", "completed_date"]
+
+    @pytest.mark.parametrize(
+        ("query", "index"),
+        [
+            (
+                "SELECT id FROM laundry_requests WHERE student_id = 'STU001' "
+                "ORDER BY submission_date DESC",
+                "ix_laundry_requests_student_id_submission_date",
+            ),
+            (
+                "SELECT id FROM laundry_requests WHERE status = 'completed' "
+                "ORDER BY completed_date DESC LIMIT 20",
+                "ix_laundry_requests_status_completed_date",
+            ),
+        ],
+    )
+    def test_ordered_lookups_need_no_sort(self, db_session, query, index):
+        plan = [row[-1] for row in db_session.execute(text(f"EXPLAIN QUERY PLAN {query}"))]
+        assert any(index in step for step in plan)
+        assert not any("TEMP B-TREE" in step for step in plan)
+
+
+# ---------------------------------------------------------------------------
+# UtcNow
+# ---------------------------------------------------------------------------
+
+
+class TestUtcNow:
+    def test_sqlite_keeps_sub_second_precision(self):
+        sql = str(select(UtcNow()).compile(dialect=sqlite.dialect()))
+        assert "STRFTIME('%Y-%m-%d %H:%M:%f', 'now')" in sql
+
+    def test_other_dialects_use_current_timestamp(self):
+        sql = str(select(UtcNow()).compile(dialect=mysql.dialect()))
+        assert "CURRENT_TIMESTAMP" in sql
+
+    def test_postgresql_converts_to_utc(self):
+        sql = str(select(UtcNow()).compile(dialect=postgresql.dialect()))
+        assert "TIMEZONE('utc', CURRENT_TIMESTAMP)" in sql
+
+    def test_it_evaluates_to_the_current_utc_time(self, db_session):
+        before = datetime.utcnow() - timedelta(seconds=5)
+        stamped = db_session.scalar(select(UtcNow()))
+        after = datetime.utcnow() + timedelta(seconds=5)
+        assert isinstance(stamped, datetime)
+        assert before <= stamped <= after
+
+    @pytest.mark.parametrize(
+        "column",
+        [Student.created_at, Admin.created_at, LaundryRequest.submission_date],
+    )
+    def test_timestamp_columns_default_to_the_database_clock(self, column):
+        assert isinstance(column.default.arg, UtcNow)
@@ -1,4 +1,4 @@
-"""Tests for services/quota.py -- quantity parsing, validation and deduction.
+"""Tests for services/quota.py -- quantity parsing and validation.
 
 These used to be route tests: every case here was previously expressed as a
 ``POST /student/submit`` through Flask's test client. Calling the service
@@ -207,96 +207,6 @@ class TestCheckRejectsQuotaExceeded:
             quota.check(None, 5)
 
 
-# ---------------------------------------------------------------------------
-# deduct
-# ---------------------------------------------------------------------------
-
-
-class TestDeduct:
-    def test_subtracts_exactly_the_requested_amount(self, fake_student):
-        student = fake_student(30)
-        quota.deduct(student, 5)
-        assert student.remaining_quota == 25
-
-    def test_returns_the_new_balance(self, fake_student):
-        assert quota.deduct(fake_student(30), 5) == 25
-
-    def test_deducting_the_whole_quota_zeroes_it(self, fake_student):
-        student = fake_student(30)
-        quota.deduct(student, 30)
-        assert student.remaining_quota == 0
-
-    def test_repeated_deductions_accumulate(self, fake_student):
-        student = fake_student(30)
-        for _ in range(3):
-            quota.deduct(student, 4)
-        assert student.remaining_quota == 18
-
-    def test_deducting_one_leaves_the_rest(self, fake_student):
-        student = fake_student(30)
-        quota.deduct(student, 1)
-        assert student.remaining_quota == 29
-
-    def test_deduct_does_not_validate(self, fake_student):
-        # BUG: deduct has no guard of its own -- it trusts that check() ran
-        # first. Called directly with an over-quota amount it drives the
-        # balance negative, and there is no CHECK (remaining_quota >= 0)
-        # constraint in models.py to catch that at the database. This is the
-        # same read-check-write gap the route has under concurrency: two
-        # requests can both pass check() before either deducts. Correct
-        # behaviour: an atomic conditional UPDATE plus a non-negative
-        # constraint.
-        student = fake_student(10)
-        quota.deduct(student, 25)
-        assert student.remaining_quota == -15
-
-    def test_deducting_a_negative_amount_inflates_the_quota(self, fake_student):
-        # BUG: the classic `quota -= -5`. Unreachable today because check()
-        # rejects non-positive amounts first, but nothing in deduct itself
-        # prevents it.
-        student = fake_student(30)
-        quota.deduct(student, -5)
-        assert student.remaining_quota == 35
-
-    def test_works_on_a_real_student_row(self, student):
-        quota.deduct(student, 12)
-        assert student.remaining_quota == 18
-
-    def test_does_not_commit(self, student, db_session):
-        """Persistence is the caller's job."""
-        quota.deduct(student, 12)
-        db_session.rollback()
-        assert student.remaining_quota == 30
-
-
-# ---------------------------------------------------------------------------
-# The check -> deduct sequence
-# ---------------------------------------------------------------------------
-
-
-class TestCheckThenDeduct:
-    def test_the_happy_path_leaves_the_expected_balance(self, fake_student):
-        student = fake_student(30)
-        quota.check(student, 5)
-        quota.deduct(student, 5)
-        assert student.remaining_quota == 25
-
-    def test_a_rejected_request_leaves_the_balance_alone(self, fake_student):
-        student = fake_student(30)
-        with pytest.raises(QuotaExceeded):
-            quota.check(student, 31)
-        assert student.remaining_quota == 30
-
-    def test_the_quota_can_be_spent_down_to_exactly_zero(self, fake_student):
-        student = fake_student(30)
-        for amount in (10, 10, 10):
-            quota.check(student, amount)
-            quota.deduct(student, amount)
-        assert student.remaining_quota == 0
-        with pytest.raises(QuotaExceeded):
-            quota.check(student, 1)
-
-
 # ---------------------------------------------------------------------------
 # Error taxonomy
 # ---------------------------------------------------------------------------
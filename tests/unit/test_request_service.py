@@ -9,6 +9,8 @@ import pathlib
 from datetime import datetime, timedelta
 
 import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
 
 from models import LaundryRequest, Student
 from services import requests as request_service
@@ -169,24 +171,56 @@ class TestSubmitRejections:
 
 
 class TestSubmitConcurrencySemantics:
-    def test_the_quota_check_and_the_deduction_are_not_atomic(self, db_session, make_student):
-        """Sequentially the second request is correctly rejected.
-
-        A real race needs threads; this documents the shape of the window.
-        """
+    def test_sequential_overspend_is_rejected(self, db_session, make_student):
         student = make_student(student_id="STU001", remaining_quota=10)
         request_service.submit(db_session, student, 10)
         with pytest.raises(QuotaExceeded):
             request_service.submit(db_session, student, 10)
         assert db_session.query(LaundryRequest).count() == 1
-        # BUG: submit() is a read-check-write with no row lock and no
-        # CHECK (remaining_quota >= 0) constraint behind it, so under real
-        # concurrency two callers can both pass quota.check before either
-        # commits its deduction and drive the balance negative. Correct
-        # behaviour: SELECT ... FOR UPDATE (or an atomic conditional UPDATE)
-        # plus a non-negative database constraint.
         assert student.remaining_quota == 0
 
+    def test_a_stale_balance_cannot_overspend(self, engine, db_session, make_student):
+        """Two sessions load the same balance; only the first submission wins.
+
+        The second caller's in-memory ``remaining_quota`` still says 10, so
+        ``quota.check`` passes -- it is the conditional UPDATE that refuses.
+        """
+        make_student(student_id="STU001", remaining_quota=10)
+        other_session = sessionmaker(bind=engine)()
+        try:
+            mine = db_session.query(Student).filter_by(student_id="STU001").one()
+            theirs = other_session.query(Student).filter_by(student_id="STU001").one()
+
+            request_service.submit(other_session, theirs, 10)
+
+            with pytest.raises(QuotaExceeded) as excinfo:
+                request_service.submit(db_session, mine, 10)
+        finally:
+            other_session.close()
+
+        assert excinfo.value.remaining == 0
+        assert mine.remaining_quota == 0
+        assert db_session.query(LaundryRequest).count() == 1
+        db_session.expunge_all()
+        assert db_session.query(Student).filter_by(student_id="STU001").one().remaining_quota == 0
+
+    def test_the_deduction_is_a_single_conditional_update(self, engine, db_session, student):
+        statements = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", _record)
+        try:
+            request_service.submit(db_session, student, 5)
+        finally:
+            event.remove(engine, "before_cursor_execute", _record)
+
+        updates = [sql for sql in statements if sql.startswith("UPDATE students")]
+        assert len(updates) == 1
+        assert "remaining_quota >=" in updates[0]
+        assert "RETURNING" in updates[0]
+
 
 # ---------------------------------------------------------------------------
 # set_status -- the documented transitions
@@ -222,6 +256,16 @@ class TestSetStatus:
         assert job.completed_date is not None
         assert before <= job.completed_date <= after
 
+    def test_an_immediate_completion_is_not_stamped_before_its_submission(
+        self, db_session, student
+    ):
+        # Both stamps come from the database clock; with one from Python's and
+        # one from SQLite's whole-second CURRENT_TIMESTAMP, this finished
+        # "before" it was submitted.
+        created = request_service.submit(db_session, student, 5)
+        request_service.set_status(db_session, created, "completed")
+        assert created.completed_date >= created.submission_date
+
     def test_the_completed_date_can_be_pinned(self, db_session, job):
         pinned = datetime(2026, 3, 4, 5, 6, 7)
         request_service.set_status(db_session, job, "completed", now=pinned)